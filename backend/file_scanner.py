@@ -2,28 +2,83 @@
 Scanner de arquivos desnecessários
 """
 
+import ctypes
+import functools
 import os
+import platform
+import re
+import string
+import sys
+import threading
 import time
-from pathlib import Path
-from typing import List, Dict, Optional
-from dataclasses import dataclass
-from backend.safety_checker import SafetyChecker
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Iterator, List, Dict, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from backend.safety_checker import FileKey, SafetyChecker
 
 
-@dataclass
+def list_logical_drives() -> List[str]:
+    """
+    Retorna as unidades existentes no Windows (ex: ['C:', 'D:'])
+    
+    Uma única chamada a GetLogicalDrives devolve a máscara de bits das
+    unidades, sem acessar cada uma delas (o que acordaria discos removíveis
+    em repouso). Fora do Windows retorna uma lista vazia.
+    """
+    if platform.system() != "Windows":
+        return []
+    
+    mask = ctypes.windll.kernel32.GetLogicalDrives()
+    return [f"{letter}:" for bit, letter in enumerate(string.ascii_uppercase) if mask & (1 << bit)]
+
+
+@dataclass(frozen=True, slots=True)
 class FileInfo:
-    """Informações sobre um arquivo encontrado"""
+    """
+    Informações sobre um arquivo encontrado
+    
+    Imutável e com __slots__ (sem __dict__ por instância): uma varredura pode
+    manter centenas de milhares destes objetos em memória.
+    """
     path: str
     size: int
     category: str
     last_modified: float
     is_safe: bool
     reason: str = ""
+    # Textos exibidos na tabela, formatados uma única vez na criação
+    size_str: str = field(init=False, repr=False, compare=False)
+    mtime_str: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        """Converte tamanho para formato legível"""
-        self.size_mb = self.size / (1024 * 1024)
-        self.size_gb = self.size / (1024 * 1024 * 1024)
+        """Formata tamanho e data de modificação para exibição"""
+        try:
+            mtime_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.last_modified))
+        except (OSError, OverflowError, ValueError):
+            # Datas fora do intervalo suportado pela plataforma
+            mtime_str = ""
+        # Dataclass congelada: os campos derivados são gravados com object.__setattr__
+        object.__setattr__(self, "size_str", self._format_size(self.size))
+        object.__setattr__(self, "mtime_str", mtime_str)
+    
+    @staticmethod
+    def _format_size(size: int) -> str:
+        """Formata o tamanho em KB, MB ou GB"""
+        if size < 1024 * 1024:
+            return f"{size / 1024:.2f} KB"
+        if size < 1024 * 1024 * 1024:
+            return f"{size / (1024 * 1024):.2f} MB"
+        return f"{size / (1024 * 1024 * 1024):.2f} GB"
+    
+    @property
+    def size_mb(self) -> float:
+        """Tamanho em MB (calculado sob demanda)"""
+        return self.size / (1024 * 1024)
+    
+    @property
+    def size_gb(self) -> float:
+        """Tamanho em GB (calculado sob demanda)"""
+        return self.size / (1024 * 1024 * 1024)
 
 
 class FileScanner:
@@ -64,17 +119,53 @@ class FileScanner:
         },
     }
     
+    # Notificações de progresso são agrupadas: no máximo a cada 100 diretórios ou 100 ms
+    # (na limpeza, a cada 100 arquivos)
+    PROGRESS_BATCH_SIZE = 100
+    PROGRESS_INTERVAL_NS = 100_000_000
+    
     def __init__(self):
         """Inicializa o scanner"""
         self.safety_checker = SafetyChecker()
+        # Veredito de segurança por diretório, compartilhado por todos os seus arquivos
+        self._dir_safety = functools.lru_cache(maxsize=4096)(self.safety_checker.is_safe_directory)
         self.scanned_files: List[FileInfo] = []
         self.total_size = 0
         self.scan_progress_callback = None
+        self.scan_batch_callback = None
+        self._progress_lock = threading.Lock()
+        self._pending_progress: List[str] = []
+        self._last_flush_ns = time.monotonic_ns()
+        self._cancel = threading.Event()
+        # Varredura é limitada por I/O: mais threads que núcleos compensa
+        self.max_workers = min(32, (os.cpu_count() or 1) * 4)
+        self.max_depth = 10  # Profundidade máxima de diretórios a partir da raiz do drive
+        # Limites de tamanho dos arquivos listados; arquivos muito pequenos
+        # quase não liberam espaço e costumam ser a maioria nos caches
+        self.min_size_bytes = 4096
+        self.max_size_bytes: Optional[int] = None  # None = sem limite
+        self._compile_categories()
     
     def set_progress_callback(self, callback):
-        """Define callback para progresso da varredura"""
+        """
+        Define callback para progresso da varredura
+        
+        O callback recebe uma lista com os diretórios escaneados desde a
+        última chamada e é chamado a partir das threads de varredura (uma
+        chamada por vez).
+        """
         self.scan_progress_callback = callback
     
+    def set_batch_callback(self, callback):
+        """
+        Define callback para os lotes de arquivos encontrados
+        
+        Durante scan_drives, o callback recebe cada lote de FileInfo assim que
+        ele fica pronto (na thread que chamou scan_drives). A lista recebida
+        não é alterada depois pelo scanner.
+        """
+        self.scan_batch_callback = callback
+    
     def scan_drives(self, drives: Optional[List[str]] = None) -> List[FileInfo]:
         """
         Escaneia unidades de disco em busca de arquivos desnecessários
@@ -86,168 +177,373 @@ class FileScanner:
         Returns:
             Lista de FileInfo com arquivos encontrados
         """
+        files: List[FileInfo] = []
+        for batch in self.scan_drives_iter(drives):
+            files.extend(batch)
+            if self.scan_batch_callback:
+                self.scan_batch_callback(batch)
+        self.scanned_files = files
+        # Soma única no final, em vez de um acumulador compartilhado por arquivo
+        self.total_size = sum(file_info.size for file_info in self.scanned_files)
+        return self.scanned_files
+    
+    def scan_drives_iter(self, drives: Optional[List[str]] = None,
+                         batch_size: int = 500) -> Iterator[List[FileInfo]]:
+        """
+        Escaneia unidades de disco entregando os arquivos encontrados em lotes
+        
+        Cada diretório é uma tarefa do pool de threads; os subdiretórios
+        encontrados viram novas tarefas, então threads livres pegam trabalho
+        de qualquer drive. A varredura é limitada por I/O, então as threads
+        avançam em paralelo.
+        
+        Os lotes são entregues conforme as tarefas terminam, sem acumular a
+        varredura inteira em memória (scanned_files e total_size só são
+        preenchidos por scan_drives). A varredura para quando cancel_scan()
+        é chamado ou quando o gerador é fechado.
+        
+        Args:
+            drives: Lista de drives para escanear (ex: ['C:', 'D:']). 
+                   Se None, escaneia todas as unidades disponíveis.
+            batch_size: Quantidade aproximada de arquivos por lote
+        
+        Yields:
+            Listas de FileInfo com arquivos encontrados
+        """
         if drives is None:
             drives = self._get_available_drives()
         
         self.scanned_files = []
         self.total_size = 0
+        self._cancel.clear()
+        self._dir_safety.cache_clear()
+        self._update_age_cutoffs()
         
-        for drive in drives:
-            self._scan_directory(drive + "\\", drive)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Tarefas em andamento -> profundidade do diretório
+            pending: Dict[Future, int] = {
+                executor.submit(self._scan_directory, drive + "\\"): 0
+                for drive in drives
+            }
+            batch: List[FileInfo] = []
+            
+            try:
+                while pending and not self._cancel.is_set():
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        depth = pending.pop(future)
+                        files, subdirectories = future.result()
+                        # Cada tarefa devolve sua própria lista; a junção acontece só aqui
+                        batch.extend(files)
+                        
+                        if depth + 1 < self.max_depth:
+                            for subdirectory in subdirectories:
+                                pending[executor.submit(self._scan_directory, subdirectory)] = depth + 1
+                    
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+                
+                if batch:
+                    yield batch
+            
+            finally:
+                # Cancelamento ou gerador fechado: descarta as tarefas que ainda não começaram
+                for future in pending:
+                    future.cancel()
         
-        return self.scanned_files
+        self._flush_progress()
+    
+    def cancel_scan(self):
+        """Interrompe a varredura em andamento (pode ser chamado de outra thread)"""
+        self._cancel.set()
     
     def _get_available_drives(self) -> List[str]:
         """Retorna lista de drives disponíveis no Windows"""
-        import string
-        drives = []
-        for letter in string.ascii_uppercase:
-            drive = f"{letter}:"
-            if os.path.exists(drive + "\\"):
-                drives.append(drive)
-        return drives
-    
-    def _scan_directory(self, directory: str, root_drive: str, max_depth: int = 10, current_depth: int = 0):
+        return list_logical_drives()
+    
+    def _scan_directory(self, directory: str) -> Tuple[List[FileInfo], List[str]]:
         """
-        Escaneia recursivamente um diretório
+        Escaneia os arquivos de um único diretório, sem descer nos subdiretórios
+        
+        Cada chamada é uma unidade de trabalho do pool de threads: os
+        subdiretórios retornados viram novas tarefas em scan_drives.
         
         Args:
             directory: Diretório para escanear
-            root_drive: Drive raiz sendo escaneado
-            max_depth: Profundidade máxima de recursão
-            current_depth: Profundidade atual
+            
+        Returns:
+            Tupla (arquivos encontrados, subdiretórios a escanear)
         """
-        if current_depth >= max_depth:
-            return
+        files: List[FileInfo] = []
+        subdirectories: List[str] = []
+        
+        if self._cancel.is_set():
+            return files, subdirectories
+        
+        # Árvores protegidas são descartadas só pelo caminho, antes de resolvê-lo
+        if self.safety_checker.is_protected_subtree(os.path.join(self._normalize_path(directory), "")):
+            return files, subdirectories
+        
+        # Verifica se o diretório é seguro para escanear
+        dir_is_safe, reason = self._dir_safety(directory)
+        if not dir_is_safe and "diretório protegido" in reason.lower():
+            return files, subdirectories  # Pula diretórios protegidos completamente
         
         try:
-            # Verifica se o diretório é seguro para escanear
-            is_safe, reason = self.safety_checker.is_safe_to_delete(directory)
-            if not is_safe and "diretório protegido" in reason.lower():
-                return  # Pula diretórios protegidos completamente
-            
-            # Verifica se o diretório existe e é acessível
-            if not os.path.exists(directory) or not os.path.isdir(directory):
-                return
-            
-            # Notifica progresso
-            if self.scan_progress_callback:
-                self.scan_progress_callback(directory)
-            
-            # Escaneia arquivos no diretório atual
-            try:
-                entries = os.listdir(directory)
-            except PermissionError:
-                return  # Sem permissão, pula
-            
-            for entry in entries:
-                entry_path = os.path.join(directory, entry)
+            with os.scandir(directory) as entries:
+                # Notifica progresso
+                self._notify_progress(directory)
                 
-                try:
-                    # Verifica se é arquivo
-                    if os.path.isfile(entry_path):
-                        file_info = self._analyze_file(entry_path)
-                        if file_info:
-                            self.scanned_files.append(file_info)
-                            self.total_size += file_info.size
+                for entry in entries:
+                    try:
+                        # Verifica se é arquivo (sem seguir links simbólicos)
+                        if entry.is_file(follow_symlinks=False):
+                            if not dir_is_safe:
+                                continue  # Não inclui arquivos de diretórios não seguros
+                            file_info = self._analyze_file(entry)
+                            if file_info:
+                                files.append(file_info)
+                        
+                        # Subdiretórios são escaneados depois de fechar o iterador
+                        elif entry.is_dir(follow_symlinks=False):
+                            subdirectories.append(entry.path)
                     
-                    # Continua recursão para subdiretórios
-                    elif os.path.isdir(entry_path):
-                        self._scan_directory(entry_path, root_drive, max_depth, current_depth + 1)
-                
-                except (PermissionError, OSError):
-                    continue  # Pula arquivos/diretórios inacessíveis
+                    except OSError:
+                        continue  # Pula arquivos/diretórios inacessíveis
+        except OSError:
+            pass  # Sem permissão ou diretório inexistente, pula
         
-        except Exception:
-            pass  # Continua mesmo em caso de erro
+        return files, subdirectories
     
-    def _analyze_file(self, file_path: str) -> Optional[FileInfo]:
+    def _notify_progress(self, directory: str):
+        """
+        Registra um diretório escaneado e chama o callback de progresso em lotes
+        
+        Chamadas das threads são serializadas; o callback só é chamado a cada
+        PROGRESS_BATCH_SIZE diretórios ou PROGRESS_INTERVAL_NS nanossegundos.
+        """
+        if not self.scan_progress_callback:
+            return
+        
+        with self._progress_lock:
+            self._pending_progress.append(directory)
+            now = time.monotonic_ns()
+            if (len(self._pending_progress) >= self.PROGRESS_BATCH_SIZE
+                    or now - self._last_flush_ns >= self.PROGRESS_INTERVAL_NS):
+                self._flush_progress_locked(now)
+    
+    def _flush_progress(self):
+        """Entrega ao callback os diretórios ainda pendentes"""
+        with self._progress_lock:
+            self._flush_progress_locked(time.monotonic_ns())
+    
+    def _flush_progress_locked(self, now: int):
+        """Entrega o lote pendente ao callback (exige _progress_lock)"""
+        batch = self._pending_progress
+        self._pending_progress = []
+        self._last_flush_ns = now
+        if batch and self.scan_progress_callback:
+            self.scan_progress_callback(batch)
+    
+    def _analyze_file(self, entry: os.DirEntry) -> Optional[FileInfo]:
         """
         Analisa um arquivo para determinar se é desnecessário
         
         Args:
-            file_path: Caminho do arquivo
+            entry: Entrada do os.scandir correspondente ao arquivo
             
         Returns:
             FileInfo se o arquivo for desnecessário, None caso contrário
         """
+        # Obtém informações do arquivo (um único stat para tamanho e data);
+        # é a única chamada ao sistema aqui, o restante não gera exceções
         try:
-            path_obj = Path(file_path)
-            file_name = path_obj.name.lower()
-            file_ext = path_obj.suffix.lower()
-            normalized_path = os.path.normpath(file_path).lower()
-            
-            # Verifica segurança primeiro
-            is_safe, reason = self.safety_checker.is_safe_to_delete(file_path)
-            if not is_safe:
-                return None  # Não inclui arquivos não seguros
-            
-            # Obtém informações do arquivo
-            stat = os.stat(file_path)
-            file_size = stat.st_size
-            last_modified = stat.st_mtime
-            
-            # Categoriza o arquivo
-            category = self._categorize_file(file_name, file_ext, normalized_path, last_modified)
-            
-            if category:
-                return FileInfo(
-                    path=file_path,
-                    size=file_size,
-                    category=category,
-                    last_modified=last_modified,
-                    is_safe=True,
-                    reason=""
-                )
-            
+            stat = entry.stat(follow_symlinks=False)
+        except OSError:
+            return None
+        file_size = stat.st_size
+        last_modified = stat.st_mtime
+        
+        # Filtra pelo tamanho antes de qualquer processamento de strings
+        if file_size < self.min_size_bytes:
+            return None
+        if self.max_size_bytes is not None and file_size > self.max_size_bytes:
             return None
         
-        except Exception:
+        # Nome, extensão e caminho são normalizados uma única vez
+        key = FileKey.build(entry.name.lower(), self._normalize_path(entry.path), last_modified, file_size)
+        
+        # Verifica segurança (o diretório já foi verificado em _scan_directory)
+        is_safe, reason = self.safety_checker.is_safe_to_delete_key(key)
+        if not is_safe:
+            return None  # Não inclui arquivos não seguros
+        
+        # Categoriza o arquivo
+        category = self._categorize_file(key)
+        
+        if category:
+            return FileInfo(
+                path=entry.path,
+                size=file_size,
+                category=category,
+                last_modified=last_modified,
+                is_safe=True,
+                reason=""
+            )
+        
+        return None
+    
+    @staticmethod
+    def _normalize_path(file_path: str) -> str:
+        """
+        Normaliza um caminho (lowercase, separador do sistema)
+        
+        Os caminhos vêm do os.scandir e já estão normalizados, então basta
+        unificar os separadores em vez de chamar os.path.normpath.
+        """
+        normalized_path = file_path.lower()
+        if os.altsep:
+            normalized_path = normalized_path.replace(os.altsep, os.sep)
+        return normalized_path
+    
+    def _compile_categories(self):
+        """
+        Pré-compila as regras de CATEGORIES para a categorização por arquivo
+        
+        Todos os padrões de nome (e todos os caminhos) viram uma única regex
+        com um grupo nomeado por categoria, de modo que uma só passada encontra
+        todas as categorias presentes. As extensões viram um dicionário.
+        
+        Como só as categorias anteriores à da extensão podem vencê-la, são
+        compiladas também regexes restritas a cada prefixo da ordem de
+        categorias; para ".tmp" ou ".cache" nenhuma regex precisa rodar.
+        """
+        # Nomes internados: todo FileInfo referencia a mesma string da categoria
+        self._category_order: Tuple[str, ...] = tuple(sys.intern(category) for category in self.CATEGORIES)
+        self._category_age_days: Dict[str, int] = {
+            category: self.CATEGORIES[category]["age_days"]
+            for category in self._category_order
+            if "age_days" in self.CATEGORIES[category]
+        }
+        
+        self._ext_to_category: Dict[str, str] = {}
+        # Posição da categoria da extensão, usada para limitar a busca por padrões.
+        # Categorias com idade mínima ficam de fora e seguem pelo caminho completo.
+        self._ext_rank: Dict[str, int] = {}
+        for rank, category in enumerate(self._category_order):
+            for extension in self.CATEGORIES[category]["extensions"]:
+                # Uma extensão pertence à primeira categoria que a declara
+                extension = extension.lower()
+                if extension in self._ext_to_category:
+                    continue
+                self._ext_to_category[extension] = category
+                if category not in self._category_age_days:
+                    self._ext_rank[extension] = rank
+        
+        # _category_regexes[n] considera apenas as n primeiras categorias
+        self._category_regexes: List[Tuple[Optional["re.Pattern[str]"], Optional["re.Pattern[str]"]]] = [
+            (self._build_category_regex("patterns", self._category_order[:rank]),
+             self._build_category_regex("paths", self._category_order[:rank]))
+            for rank in range(len(self._category_order) + 1)
+        ]
+        self._update_age_cutoffs()
+    
+    def _build_category_regex(self, key: str, categories: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+        """
+        Monta a regex combinada para uma lista de CATEGORIES ("patterns" ou "paths")
+        
+        As alternativas ficam dentro de um lookahead, então o finditer testa
+        todas as posições e não perde padrões sobrepostos.
+        
+        Args:
+            key: Chave da configuração da categoria
+            categories: Categorias incluídas na regex
+            
+        Returns:
+            Regex compilada ou None se nenhuma categoria tiver padrões
+        """
+        alternatives = []
+        for category in categories:
+            config = self.CATEGORIES[category]
+            patterns = dict.fromkeys(pattern.lower() for pattern in config[key])
+            if patterns:
+                joined = "|".join(re.escape(pattern) for pattern in patterns)
+                alternatives.append(f"(?P<{category}>{joined})")
+        
+        if not alternatives:
             return None
+        return re.compile("(?=(?:" + "|".join(alternatives) + "))")
     
-    def _categorize_file(self, file_name: str, file_ext: str, file_path: str, last_modified: float) -> Optional[str]:
+    @staticmethod
+    def _find_categories(pattern: Optional["re.Pattern[str]"], text: str) -> Set[str]:
+        """Retorna as categorias cujos padrões aparecem no texto"""
+        if pattern is None:
+            return set()
+        return {match.lastgroup for match in pattern.finditer(text)}
+    
+    def _categorize_file(self, key: FileKey) -> Optional[str]:
         """
         Categoriza um arquivo baseado em padrões
         
         Args:
-            file_name: Nome do arquivo (lowercase)
-            file_ext: Extensão do arquivo (lowercase)
-            file_path: Caminho completo (lowercase, normalized)
-            last_modified: Timestamp da última modificação
+            key: Dados normalizados do arquivo (nome, extensão, caminho e data)
             
         Returns:
             Nome da categoria ou None se não for desnecessário
         """
-        current_time = time.time()
+        file_ext = key.ext_lower
+        last_modified = key.mtime
+        ext_category = self._ext_to_category.get(file_ext)
+        rank = self._ext_rank.get(file_ext, len(self._category_order))
+        name_re, path_re = self._category_regexes[rank]
         
-        for category, config in self.CATEGORIES.items():
-            # Verifica padrões no nome
-            if config["patterns"]:
-                if any(pattern.lower() in file_name for pattern in config["patterns"]):
-                    # Verifica idade se necessário
-                    if "age_days" in config:
-                        age_days = (current_time - last_modified) / (24 * 3600)
-                        if age_days < config["age_days"]:
-                            continue
-                    return category
+        # Nenhuma categoria anterior pode vencer a da extensão
+        if name_re is None and path_re is None:
+            return ext_category
+        
+        name_matches = self._find_categories(name_re, key.name_lower)
+        path_matches = self._find_categories(path_re, key.path_lower)
+        
+        if not name_matches and not path_matches:
+            return ext_category
+        
+        # Mesma precedência das regras originais: categorias em ordem e,
+        # dentro de cada uma, nome, extensão e caminho. Arquivos modificados
+        # depois do limite da categoria são recentes demais para ela.
+        for category, cutoff in self._compiled_categories:
+            if category in name_matches:
+                if cutoff is not None and last_modified > cutoff:
+                    continue
+                return category
             
-            # Verifica extensões
-            if config["extensions"]:
-                if file_ext in config["extensions"]:
-                    return category
+            if category == ext_category:
+                return category
             
-            # Verifica caminhos
-            if config["paths"]:
-                if any(path.lower() in file_path for path in config["paths"]):
-                    # Verifica idade se necessário
-                    if "age_days" in config:
-                        age_days = (current_time - last_modified) / (24 * 3600)
-                        if age_days < config["age_days"]:
-                            continue
-                    return category
+            if category in path_matches:
+                if cutoff is not None and last_modified > cutoff:
+                    continue
+                return category
         
         return None
     
+    def _update_age_cutoffs(self):
+        """
+        Monta a tabela (categoria, timestamp limite) usada por _categorize_file
+        
+        A idade mínima de cada categoria vira um timestamp limite calculado uma
+        vez por varredura, evitando chamar time.time() e fazer a conversão para
+        dias a cada arquivo. A tabela é uma tupla plana para o laço por arquivo
+        desempacotar direto, sem consultas a dicionários.
+        """
+        current_time = time.time()
+        self._compiled_categories: Tuple[Tuple[str, Optional[float]], ...] = tuple(
+            (category,
+             current_time - self._category_age_days[category] * 24 * 3600
+             if category in self._category_age_days else None)
+            for category in self._category_order
+        )
+    
     def get_total_size_mb(self) -> float:
         """Retorna tamanho total em MB"""
         return self.total_size / (1024 * 1024)
@@ -258,41 +554,63 @@ class FileScanner:
     
     def get_files_by_category(self) -> Dict[str, List[FileInfo]]:
         """Retorna arquivos agrupados por categoria"""
-        categorized = {}
+        categorized: Dict[str, List[FileInfo]] = {}
         for file_info in self.scanned_files:
-            if file_info.category not in categorized:
-                categorized[file_info.category] = []
-            categorized[file_info.category].append(file_info)
+            categorized.setdefault(file_info.category, []).append(file_info)
         return categorized
     
-    def delete_files(self, file_paths: List[str]) -> Dict[str, bool]:
+    def delete_files(self, file_paths: List[str],
+                     progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, bool]:
         """
         Deleta uma lista de arquivos
         
+        As remoções são distribuídas em um pequeno pool de threads para
+        sobrepor a latência do disco entre muitos arquivos pequenos.
+        
         Args:
             file_paths: Lista de caminhos de arquivos para deletar
+            progress_callback: Chamado com (processados, total) a cada
+                PROGRESS_BATCH_SIZE arquivos e ao final
             
         Returns:
             Dicionário com status de cada arquivo (True = deletado, False = erro)
         """
-        results = {}
+        results: Dict[str, bool] = {}
+        total = len(file_paths)
         
-        for file_path in file_paths:
-            try:
-                # Verifica segurança novamente antes de deletar
-                is_safe, reason = self.safety_checker.is_safe_to_delete(file_path)
-                if not is_safe:
-                    results[file_path] = False
-                    continue
-                
-                # Deleta o arquivo
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    results[file_path] = True
-                else:
-                    results[file_path] = False
-            
-            except Exception:
-                results[file_path] = False
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            deleted_iter = zip(file_paths, executor.map(self._delete_file, file_paths))
+            for done, (file_path, deleted) in enumerate(deleted_iter, 1):
+                results[file_path] = deleted
+                if progress_callback and (done % self.PROGRESS_BATCH_SIZE == 0 or done == total):
+                    progress_callback(done, total)
         
         return results
+    
+    def _delete_file(self, file_path: str) -> bool:
+        """
+        Deleta um arquivo após verificar sua segurança novamente
+        
+        Args:
+            file_path: Caminho do arquivo
+            
+        Returns:
+            True se o arquivo foi deletado
+        """
+        # Verifica segurança novamente antes de deletar; o veredito do
+        # diretório normalmente já está no cache da varredura
+        dir_is_safe, reason = self._dir_safety(os.path.dirname(file_path))
+        if not dir_is_safe:
+            return False
+        
+        key = FileKey.build(os.path.basename(file_path).lower(), self._normalize_path(file_path))
+        is_safe, reason = self.safety_checker.is_safe_to_delete_key(key)
+        if not is_safe:
+            return False
+        
+        # Deleta o arquivo (um arquivo inexistente gera FileNotFoundError)
+        try:
+            os.unlink(file_path)
+            return True
+        except OSError:
+            return False
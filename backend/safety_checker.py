@@ -2,10 +2,32 @@
 Sistema de segurança para evitar deletar arquivos importantes
 """
 
+import bisect
 import os
 import platform
 from pathlib import Path
-from typing import Set, List, Tuple
+from typing import Set, FrozenSet, List, NamedTuple, Tuple
+
+
+class FileKey(NamedTuple):
+    """
+    Dados de um arquivo normalizados uma única vez
+    
+    Compartilhados entre FileScanner e SafetyChecker para que nenhuma etapa
+    precise chamar .lower() de novo.
+    """
+    name_lower: str
+    ext_lower: str
+    path_lower: str
+    mtime: float = 0.0
+    size: int = 0
+    
+    @classmethod
+    def build(cls, name_lower: str, path_lower: str, mtime: float = 0.0, size: int = 0) -> "FileKey":
+        """Cria a chave extraindo a extensão do nome (um ponto inicial não inicia extensão)"""
+        dot = name_lower.rfind(".")
+        ext_lower = name_lower[dot:] if dot > 0 else ""
+        return cls(name_lower, ext_lower, path_lower, mtime, size)
 
 
 class SafetyChecker:
@@ -28,23 +50,39 @@ class SafetyChecker:
     }
     
     # Extensões críticas que nunca devem ser deletadas
-    PROTECTED_EXTENSIONS: Set[str] = {
+    PROTECTED_EXTENSIONS: FrozenSet[str] = frozenset({
         ".exe", ".dll", ".sys", ".drv", ".ocx", ".cpl",
         ".msi", ".msm", ".msp", ".bat", ".cmd", ".ps1",
         ".reg", ".inf", ".cat", ".cer", ".crt", ".key",
         ".pfx", ".p12", ".p7b", ".p7c", ".p7m", ".p7s",
-    }
+    })
     
     # Nomes de arquivos críticos do sistema
-    PROTECTED_FILENAMES: Set[str] = {
+    PROTECTED_FILENAMES: FrozenSet[str] = frozenset({
         "boot.ini", "ntldr", "ntdetect.com", "bootmgr",
         "bootmgr.efi", "bcd", "boot.sdi", "winload.exe",
         "winload.efi", "winresume.exe", "winresume.efi",
-    }
+    })
+    
+    # Trechos de caminho que indicam arquivos temporários conhecidos
+    TEMPORARY_INDICATORS: Tuple[str, ...] = (
+        "\\Temp\\",
+        "\\tmp\\",
+        "\\AppData\\Local\\Temp\\",
+        "\\AppData\\Local\\Microsoft\\Windows\\INetCache\\",
+        "\\AppData\\Local\\Microsoft\\Windows\\Temporary Internet Files\\",
+        "\\Windows\\Temp\\",
+        "\\Windows\\Prefetch\\",
+        "\\Windows\\SoftwareDistribution\\Download\\",
+    )
     
     def __init__(self):
         """Inicializa o verificador de segurança"""
         self._normalize_protected_paths()
+        self._temp_indicators: Tuple[str, ...] = tuple(
+            indicator.lower() for indicator in self.TEMPORARY_INDICATORS
+        )
+        self._build_protected_prefixes()
     
     def _normalize_protected_paths(self):
         """Normaliza os caminhos protegidos para o sistema atual"""
@@ -60,6 +98,21 @@ class SafetyChecker:
                 continue
         self.PROTECTED_DIRECTORIES = normalized
     
+    def _build_protected_prefixes(self):
+        """Pré-calcula os prefixos normalizados (lowercase) dos diretórios protegidos"""
+        self._protected_directories: Tuple[str, ...] = tuple(sorted(self.PROTECTED_DIRECTORIES))
+        self._protected_prefixes: Tuple[str, ...] = tuple(
+            os.path.normpath(directory).lower() for directory in self._protected_directories
+        )
+        
+        # Raízes ordenadas, sem as que já são cobertas por outra, para busca binária:
+        # assim o único candidato a prefixo de um caminho é a maior raiz <= caminho
+        roots: List[str] = []
+        for prefix in sorted(self._protected_prefixes):
+            if not roots or not prefix.startswith(roots[-1]):
+                roots.append(prefix)
+        self._protected_roots_sorted: List[str] = roots
+    
     def is_safe_to_delete(self, file_path: str) -> Tuple[bool, str]:
         """
         Verifica se um arquivo é seguro para deletar
@@ -72,65 +125,118 @@ class SafetyChecker:
         """
         try:
             path = Path(file_path)
-            normalized_path = os.path.normpath(str(path.resolve()))
+            normalized_path = os.path.normpath(str(path.resolve())).lower()
             
             # Verifica se está em diretório protegido
-            for protected_dir in self.PROTECTED_DIRECTORIES:
-                protected_normalized = os.path.normpath(protected_dir)
-                if normalized_path.startswith(protected_normalized):
-                    # Exceção: permite arquivos temporários em diretórios protegidos
-                    if not self._is_temporary_file(normalized_path):
-                        return False, f"Arquivo está em diretório protegido: {protected_dir}"
-            
-            # Verifica extensão protegida
-            if path.suffix.lower() in self.PROTECTED_EXTENSIONS:
-                # Exceção: permite alguns arquivos temporários com extensões protegidas
-                if not self._is_temporary_file(normalized_path):
-                    return False, f"Extensão protegida: {path.suffix}"
-            
-            # Verifica nome de arquivo protegido
-            if path.name.lower() in self.PROTECTED_FILENAMES:
-                return False, f"Nome de arquivo protegido: {path.name}"
+            is_safe, reason = self._check_protected_directory(normalized_path)
+            if not is_safe:
+                return is_safe, reason
             
-            # Verifica se é arquivo do sistema (atributo)
-            if path.exists():
-                try:
-                    import stat
-                    file_stat = os.stat(file_path)
-                    # Verifica se é arquivo oculto ou sistema (simplificado)
-                    if path.name.startswith('.'):
-                        return False, "Arquivo oculto do sistema"
-                except Exception:
-                    pass
+            return self.is_safe_to_delete_key(FileKey.build(path.name.lower(), normalized_path))
             
-            return True, "Arquivo seguro para deletar"
+        except Exception as e:
+            return False, f"Erro ao verificar segurança: {str(e)}"
+    
+    def is_safe_directory(self, directory: str) -> Tuple[bool, str]:
+        """
+        Verifica se os arquivos de um diretório estão fora das áreas protegidas
+        
+        O resultado vale para todos os arquivos do diretório, que então só
+        precisam passar por is_safe_to_delete_key.
+        
+        Args:
+            directory: Caminho do diretório
             
+        Returns:
+            Tupla (é_seguro, motivo)
+        """
+        try:
+            normalized_dir = os.path.normpath(str(Path(directory).resolve())).lower()
+            # O separador final faz os indicadores de temporários casarem como no caminho dos arquivos
+            return self._check_protected_directory(os.path.join(normalized_dir, ""))
+        
         except Exception as e:
             return False, f"Erro ao verificar segurança: {str(e)}"
     
+    def is_safe_to_delete_key(self, key: FileKey) -> Tuple[bool, str]:
+        """
+        Verifica as regras que dependem apenas do nome do arquivo
+        
+        Recebe os dados já normalizados, sem chamar .lower() nem acessar o
+        disco; o diretório do arquivo deve ter sido verificado à parte.
+        
+        Args:
+            key: Dados normalizados do arquivo
+            
+        Returns:
+            Tupla (é_seguro, motivo)
+        """
+        # Verifica extensão protegida
+        if key.ext_lower in self.PROTECTED_EXTENSIONS:
+            # Exceção: permite alguns arquivos temporários com extensões protegidas
+            if not self._is_temporary_file(key.path_lower):
+                return False, f"Extensão protegida: {key.ext_lower}"
+        
+        # Verifica nome de arquivo protegido
+        if key.name_lower in self.PROTECTED_FILENAMES:
+            return False, f"Nome de arquivo protegido: {key.name_lower}"
+        
+        # Verifica se é arquivo oculto ou sistema (simplificado)
+        if key.name_lower.startswith('.'):
+            return False, "Arquivo oculto do sistema"
+        
+        return True, "Arquivo seguro para deletar"
+    
+    def _check_protected_directory(self, normalized_path: str) -> Tuple[bool, str]:
+        """
+        Verifica se um caminho normalizado (lowercase) está em diretório protegido
+        
+        Args:
+            normalized_path: Caminho normalizado (lowercase)
+            
+        Returns:
+            Tupla (é_seguro, motivo)
+        """
+        if self.is_protected_subtree(normalized_path):
+            protected_dir = next(
+                directory
+                for directory, prefix in zip(self._protected_directories, self._protected_prefixes)
+                if normalized_path.startswith(prefix)
+            )
+            return False, f"Arquivo está em diretório protegido: {protected_dir}"
+        
+        return True, "Arquivo seguro para deletar"
+    
+    def is_protected_subtree(self, normalized_path: str) -> bool:
+        """
+        Verifica se um caminho está dentro de uma árvore protegida
+        
+        Usa busca binária nas raízes protegidas, sem acessar o disco.
+        
+        Args:
+            normalized_path: Caminho normalizado (lowercase)
+            
+        Returns:
+            True se o caminho está em diretório protegido e não é temporário
+        """
+        index = bisect.bisect_right(self._protected_roots_sorted, normalized_path)
+        if index == 0 or not normalized_path.startswith(self._protected_roots_sorted[index - 1]):
+            return False
+        
+        # Exceção: permite arquivos temporários em diretórios protegidos
+        return not self._is_temporary_file(normalized_path)
+    
     def _is_temporary_file(self, file_path: str) -> bool:
         """
         Verifica se é um arquivo temporário conhecido
         
         Args:
-            file_path: Caminho do arquivo
+            file_path: Caminho do arquivo normalizado (lowercase)
             
         Returns:
             True se for arquivo temporário seguro
         """
-        temp_indicators = [
-            "\\Temp\\",
-            "\\tmp\\",
-            "\\AppData\\Local\\Temp\\",
-            "\\AppData\\Local\\Microsoft\\Windows\\INetCache\\",
-            "\\AppData\\Local\\Microsoft\\Windows\\Temporary Internet Files\\",
-            "\\Windows\\Temp\\",
-            "\\Windows\\Prefetch\\",
-            "\\Windows\\SoftwareDistribution\\Download\\",
-        ]
-        
-        normalized = file_path.lower()
-        return any(indicator.lower() in normalized for indicator in temp_indicators)
+        return any(indicator in file_path for indicator in self._temp_indicators)
     
     def get_protected_directories(self) -> List[str]:
         """Retorna lista de diretórios protegidos"""
@@ -140,3 +246,4 @@ class SafetyChecker:
         """Adiciona um diretório customizado à lista de protegidos"""
         normalized = os.path.normpath(directory)
         self.PROTECTED_DIRECTORIES.add(normalized)
+        self._build_protected_prefixes()
@@ -0,0 +1,56 @@
+"""
+Proxy de filtro da tabela de arquivos
+Esconde as linhas que não contêm o texto digitado, sem copiar os arquivos
+"""
+
+from PySide6.QtCore import Qt, QModelIndex, QSortFilterProxyModel
+
+from frontend.file_table_model import FileTableModel
+
+
+class FileFilterProxy(QSortFilterProxyModel):
+    """
+    QSortFilterProxyModel que filtra a tabela de arquivos
+    
+    Cada linha é testada com uma única chamada a FileTableModel.row_matches,
+    em vez de um data() por coluna. A ordenação é repassada ao modelo de
+    origem (FileTableModel.sort), que ordena a lista inteira de uma vez;
+    comparar célula a célula aqui chamaria data() em Python duas vezes por
+    comparação. O proxy mantém a ordem da origem.
+    """
+    
+    def __init__(self, source_model: FileTableModel, parent=None):
+        """
+        Args:
+            source_model: Modelo filtrado pelo proxy
+            parent: Objeto pai
+        """
+        super().__init__(parent)
+        self.setSourceModel(source_model)
+        self._source = source_model
+        self._filter_text = ""
+    
+    def filter_text(self) -> str:
+        """Retorna o texto do filtro em uso (vazio = sem filtro)"""
+        return self._filter_text
+    
+    def set_filter_text(self, text: str):
+        """
+        Filtra as linhas que contêm o texto (sem diferenciar maiúsculas)
+        
+        Args:
+            text: Texto procurado no caminho, categoria, tamanho ou data
+        """
+        text = text.lower()
+        if text == self._filter_text:
+            return
+        self._filter_text = text
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        """Aceita a linha se ela contém o texto do filtro"""
+        return not self._filter_text or self._source.row_matches(source_row, self._filter_text)
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """Ordena no modelo de origem"""
+        self._source.sort(column, order)
@@ -0,0 +1,258 @@
+"""
+Modelo da tabela de arquivos encontrados
+Usado com QTableView: apenas as linhas visíveis são consultadas pela view
+"""
+
+import operator
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from backend.file_scanner import FileInfo
+
+
+class FileTableModel(QAbstractTableModel):
+    """Modelo com os arquivos encontrados e a seleção (checkbox) de cada um"""
+    
+    HEADERS = ["Selecionar", "Caminho", "Categoria", "Tamanho", "Última Modificação"]
+    
+    COLUMN_CHECK = 0
+    COLUMN_PATH = 1
+    COLUMN_CATEGORY = 2
+    COLUMN_SIZE = 3
+    COLUMN_MODIFIED = 4
+    
+    # Atributo do FileInfo usado para ordenar cada coluna (valor bruto, não o texto exibido)
+    SORT_ATTRIBUTES = {
+        COLUMN_PATH: "path",
+        COLUMN_CATEGORY: "category",
+        COLUMN_SIZE: "size",
+        COLUMN_MODIFIED: "last_modified",
+    }
+    
+    # Papel extra que devolve todos os papéis de uma célula de uma vez
+    MULTIPLE_ROLES = Qt.ItemDataRole.UserRole + 1000
+    
+    # Papéis respondidos por data(); os demais retornam None sem montar a célula
+    CELL_ROLES = frozenset({
+        Qt.ItemDataRole.DisplayRole,
+        Qt.ItemDataRole.CheckStateRole,
+        Qt.ItemDataRole.TextAlignmentRole,
+        Qt.ItemDataRole.ToolTipRole,
+    })
+    
+    SIZE_ALIGNMENT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+    
+    # Flags das células, combinados uma única vez: a coluna de seleção é um
+    # item marcável comum (sem um QCheckBox por linha)
+    ITEM_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    CHECK_ITEM_FLAGS = ITEM_FLAGS | Qt.ItemFlag.ItemIsUserCheckable
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._files: List[FileInfo] = []
+        # Estado do checkbox de cada linha (1 = selecionado), paralelo a _files
+        self._checked = bytearray()
+    
+    def set_files(self, files: List[FileInfo]):
+        """
+        Substitui os arquivos exibidos, todos selecionados
+        
+        O modelo guarda a própria lista recebida, sem copiá-la.
+        """
+        self.beginResetModel()
+        self._files = files
+        self._checked = bytearray(b"\x01") * len(files)
+        self.endResetModel()
+    
+    def append_files(self, files: List[FileInfo]):
+        """
+        Acrescenta arquivos ao final da tabela, já selecionados
+        
+        Apenas as novas linhas são anunciadas à view (beginInsertRows), sem
+        reconstruir as já exibidas.
+        """
+        if not files:
+            return
+        
+        first = len(self._files)
+        self.beginInsertRows(QModelIndex(), first, first + len(files) - 1)
+        self._files.extend(files)
+        self._checked.extend(b"\x01" * len(files))
+        self.endInsertRows()
+    
+    def remove_rows(self, rows: List[int]):
+        """
+        Remove as linhas indicadas, um bloco contíguo por vez
+        
+        Args:
+            rows: Índices das linhas em ordem crescente
+        """
+        # De trás para frente, para que os índices dos blocos seguintes não mudem
+        for start, end in reversed(_contiguous_ranges(rows)):
+            self.beginRemoveRows(QModelIndex(), start, end)
+            del self._files[start:end + 1]
+            del self._checked[start:end + 1]
+            self.endRemoveRows()
+    
+    def selected_paths(self, rows: Optional[Iterable[int]] = None) -> List[str]:
+        """
+        Retorna os caminhos dos arquivos selecionados
+        
+        Args:
+            rows: Se informado, considera apenas estas linhas (ex: as visíveis com filtro)
+        """
+        if rows is None:
+            return [file_info.path for file_info, checked in zip(self._files, self._checked) if checked]
+        return [self._files[row].path for row in sorted(rows) if self._checked[row]]
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Quantidade de arquivos exibidos"""
+        return 0 if parent.isValid() else len(self._files)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Quantidade de colunas da tabela"""
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Retorna os títulos das colunas"""
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """
+        Retorna o conteúdo de uma célula para o papel (role) pedido pela view
+        
+        Com MULTIPLE_ROLES retorna, em uma única chamada, um dicionário com
+        todos os papéis da célula (usado pelo SpeedUpDelegate).
+        """
+        if not index.isValid():
+            return None
+        
+        if role == self.MULTIPLE_ROLES:
+            return self._cell_roles(index.row(), index.column())
+        if role not in self.CELL_ROLES:
+            return None
+        return self._cell_roles(index.row(), index.column()).get(role)
+    
+    def _cell_roles(self, row: int, column: int) -> Dict[int, Any]:
+        """
+        Monta os papéis de uma célula lendo o FileInfo uma única vez
+        
+        Args:
+            row: Linha da célula
+            column: Coluna da célula
+            
+        Returns:
+            Dicionário papel -> valor (papéis sem valor ficam de fora)
+        """
+        file_info = self._files[row]
+        
+        if column == self.COLUMN_CHECK:
+            check_state = Qt.CheckState.Checked if self._checked[row] else Qt.CheckState.Unchecked
+            return {Qt.ItemDataRole.CheckStateRole: check_state}
+        if column == self.COLUMN_PATH:
+            return {
+                Qt.ItemDataRole.DisplayRole: file_info.path,
+                Qt.ItemDataRole.ToolTipRole: file_info.path,
+            }
+        if column == self.COLUMN_CATEGORY:
+            return {Qt.ItemDataRole.DisplayRole: file_info.category}
+        if column == self.COLUMN_SIZE:
+            return {
+                Qt.ItemDataRole.DisplayRole: file_info.size_str,
+                Qt.ItemDataRole.TextAlignmentRole: self.SIZE_ALIGNMENT,
+            }
+        if column == self.COLUMN_MODIFIED:
+            return {Qt.ItemDataRole.DisplayRole: file_info.mtime_str}
+        return {}
+    
+    def row_matches(self, row: int, text: str) -> bool:
+        """
+        Verifica se o caminho, a categoria, o tamanho ou a data da linha contém o texto
+        
+        Args:
+            row: Linha do modelo
+            text: Texto procurado, já em lowercase
+        """
+        file_info = self._files[row]
+        return (text in file_info.path.lower()
+                or text in file_info.category.lower()
+                or text in file_info.size_str.lower()
+                or text in file_info.mtime_str)
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """
+        Ordena as linhas pelo valor bruto da coluna (tamanho em bytes, timestamp...)
+        
+        A lista inteira é ordenada com sorted(), em vez de o QSortFilterProxyModel
+        comparar as células uma a uma chamando data() em Python.
+        
+        Args:
+            column: Coluna de ordenação (-1 mantém a ordem atual)
+            order: Ordem crescente ou decrescente
+        """
+        if not 0 <= column < len(self.HEADERS) or not self._files:
+            return
+        
+        files = self._files
+        checked = self._checked
+        if column == self.COLUMN_CHECK:
+            keys = checked
+        else:
+            keys = list(map(operator.attrgetter(self.SORT_ATTRIBUTES[column]), files))
+        new_order = sorted(range(len(files)), key=keys.__getitem__,
+                           reverse=order == Qt.SortOrder.DescendingOrder)
+        
+        self.layoutAboutToBeChanged.emit()
+        # A lista é reordenada no lugar: ela é compartilhada com a janela (scanned_files)
+        files[:] = [files[row] for row in new_order]
+        self._checked = bytearray(map(checked.__getitem__, new_order))
+        
+        # Índices persistentes (seleção da view, mapeamentos dos proxies) acompanham as linhas
+        persistent = self.persistentIndexList()
+        if persistent:
+            new_rows = [0] * len(new_order)
+            for new_row, old_row in enumerate(new_order):
+                new_rows[old_row] = new_row
+            self.changePersistentIndexList(
+                persistent,
+                [self.index(new_rows[index.row()], index.column()) for index in persistent],
+            )
+        self.layoutChanged.emit()
+    
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        """Marca ou desmarca o checkbox de uma linha"""
+        if (not index.isValid() or index.column() != self.COLUMN_CHECK
+                or role != Qt.ItemDataRole.CheckStateRole):
+            return False
+        
+        self._checked[index.row()] = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Apenas a coluna de seleção é marcável"""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return self.CHECK_ITEM_FLAGS if index.column() == self.COLUMN_CHECK else self.ITEM_FLAGS
+
+
+def _contiguous_ranges(rows: List[int]) -> List[Tuple[int, int]]:
+    """
+    Agrupa índices em ordem crescente em intervalos contíguos
+    
+    Args:
+        rows: Índices em ordem crescente
+        
+    Returns:
+        Lista de (início, fim) inclusivos, ex: [1, 2, 3, 7] -> [(1, 3), (7, 7)]
+    """
+    ranges: List[Tuple[int, int]] = []
+    for row in rows:
+        if ranges and ranges[-1][1] == row - 1:
+            ranges[-1] = (ranges[-1][0], row)
+        else:
+            ranges.append((row, row))
+    return ranges
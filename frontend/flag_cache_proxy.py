@@ -0,0 +1,47 @@
+"""
+Proxy da tabela de arquivos
+Memoriza os flags de cada célula para que a view não chame flags() do modelo a cada repintura
+"""
+
+from typing import Dict, Tuple
+
+from PySide6.QtCore import Qt, QAbstractItemModel, QIdentityProxyModel, QModelIndex
+
+
+class FlagCacheProxy(QIdentityProxyModel):
+    """
+    QIdentityProxyModel que guarda em cache o resultado de flags() por célula
+    
+    A view consulta flags() de cada índice visível a cada repintura; com um
+    modelo em Python cada consulta é uma chamada ao interpretador.
+    """
+    
+    def __init__(self, source_model: QAbstractItemModel, parent=None):
+        """
+        Args:
+            source_model: Modelo envolvido pelo proxy
+            parent: Objeto pai
+        """
+        super().__init__(parent)
+        self._flag_cache: Dict[Tuple[int, int], Qt.ItemFlag] = {}
+        self.setSourceModel(source_model)
+        
+        # Linhas novas, removidas ou alteradas invalidam o cache
+        source_model.dataChanged.connect(self.clear_cache)
+        source_model.modelReset.connect(self.clear_cache)
+        source_model.layoutChanged.connect(self.clear_cache)
+        source_model.rowsInserted.connect(self.clear_cache)
+        source_model.rowsRemoved.connect(self.clear_cache)
+    
+    def clear_cache(self, *args):
+        """Descarta os flags em cache"""
+        self._flag_cache.clear()
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Retorna os flags da célula, consultando o modelo de origem só na primeira vez"""
+        key = (index.row(), index.column())
+        flags = self._flag_cache.get(key)
+        if flags is None:
+            flags = super().flags(index)
+            self._flag_cache[key] = flags
+        return flags
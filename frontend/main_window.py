@@ -3,24 +3,117 @@ Janela principal da aplicação Parsews
 Interface gráfica usando PySide6
 """
 
-import os
-from typing import List
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
+import textwrap
+from contextlib import contextmanager
+from typing import List, Optional
+from PySide6.QtCore import Qt, QThread, QThreadPool, Signal, QTimer
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QLabel, QProgressBar, QTableWidget, QTableWidgetItem, QHeaderView,
-    QMessageBox, QGroupBox, QCheckBox, QComboBox, QFileDialog,
-    QSplitter, QTextEdit
+    QLabel, QProgressBar, QTableView, QAbstractItemView, QHeaderView,
+    QMessageBox, QGroupBox, QComboBox, QLineEdit
 )
-from PySide6.QtGui import QFont, QColor, QPalette
+from PySide6.QtGui import QFont
 
-from backend.file_scanner import FileScanner, FileInfo
+from backend.file_scanner import FileScanner, FileInfo, list_logical_drives
 from backend.safety_checker import SafetyChecker
+from frontend.file_filter_proxy import FileFilterProxy
+from frontend.file_table_model import FileTableModel
+from frontend.flag_cache_proxy import FlagCacheProxy
+from frontend.speed_up_delegate import SpeedUpDelegate
+
+
+# Folha de estilos da janela; montada uma única vez, na importação do módulo
+_STYLESHEET = textwrap.dedent("""
+    QMainWindow {
+        background-color: #f5f5f5;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #cccccc;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 5px;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:pressed {
+        background-color: #3d8b40;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+    QProgressBar {
+        border: 2px solid #cccccc;
+        border-radius: 5px;
+        text-align: center;
+        height: 25px;
+    }
+    QProgressBar::chunk {
+        background-color: #4CAF50;
+        border-radius: 3px;
+    }
+    QTableView {
+        border: 1px solid #cccccc;
+        border-radius: 5px;
+        background-color: white;
+        gridline-color: #e0e0e0;
+    }
+    QTableView::item {
+        padding: 5px;
+    }
+    QTableView::item:selected {
+        background-color: #e3f2fd;
+    }
+    QHeaderView::section {
+        background-color: #2196F3;
+        color: white;
+        padding: 8px;
+        border: none;
+        font-weight: bold;
+    }
+    QComboBox {
+        padding: 5px;
+        border: 1px solid #cccccc;
+        border-radius: 3px;
+        background-color: white;
+    }
+    QComboBox:hover {
+        border: 1px solid #2196F3;
+    }
+    QLineEdit {
+        padding: 5px;
+        border: 1px solid #cccccc;
+        border-radius: 3px;
+        background-color: white;
+    }
+    QLineEdit:focus {
+        border: 1px solid #2196F3;
+    }
+    QLabel {
+        color: #333333;
+    }
+""").strip()
 
 
 class ScanThread(QThread):
     """Thread para executar a varredura em background"""
-    progress = Signal(str)
+    batch_ready = Signal(list)
     finished = Signal(list)
     error = Signal(str)
     
@@ -28,25 +121,83 @@ class ScanThread(QThread):
         super().__init__()
         self.scanner = scanner
         self.drives = drives
+        # Último diretório escaneado; lido periodicamente pela interface
+        self.last_path = ""
     
     def run(self):
         """Executa a varredura"""
+        self.scanner.set_progress_callback(self._store_progress)
+        self.scanner.set_batch_callback(self._emit_batch)
         try:
             files = self.scanner.scan_drives(self.drives)
             self.finished.emit(files)
         except Exception as e:
             self.error.emit(str(e))
+    
+    def _store_progress(self, paths: List[str]):
+        """
+        Guarda o último diretório do lote de progresso
+        
+        Chamado pelas threads de trabalho do scanner: é uma única atribuição,
+        sem sinal nem acesso a widgets. A interface lê last_path com um QTimer.
+        """
+        self.last_path = paths[-1]
+    
+    def _emit_batch(self, files: List[FileInfo]):
+        """Envia um lote de arquivos encontrados para a interface"""
+        self.batch_ready.emit(files)
+        # Dá a vez à thread da interface para ela exibir o lote
+        QThread.yieldCurrentThread()
+
+
+class CleanThread(QThread):
+    """Thread para deletar arquivos em background"""
+    progress = Signal(int, int)
+    finished = Signal(dict)
+    error = Signal(str)
+    
+    def __init__(self, scanner: FileScanner, file_paths: List[str]):
+        super().__init__()
+        self.scanner = scanner
+        self.file_paths = file_paths
+    
+    def run(self):
+        """Executa a limpeza"""
+        try:
+            results = self.scanner.delete_files(self.file_paths, self.progress.emit)
+            self.finished.emit(results)
+        except Exception as e:
+            self.error.emit(str(e))
 
 
 class MainWindow(QMainWindow):
     """Janela principal da aplicação"""
+    drives_ready = Signal(list)
     
-    def __init__(self):
+    # Intervalo de atualização do diretório em varredura (~30 vezes por segundo)
+    PROGRESS_INTERVAL_MS = 33
+    
+    # Espera após a última tecla antes de refiltrar a tabela
+    FILTER_DELAY_MS = 250
+    
+    def __init__(self, defer_drives: bool = False):
+        """
+        Args:
+            defer_drives: Se True, o combo de unidades só é preenchido por
+                populate_drives_async(), fora da thread da interface
+        """
         super().__init__()
         self.scanner = FileScanner()
         self.safety_checker = SafetyChecker()
         self.scanned_files: List[FileInfo] = []
         self.scan_thread = None
+        self.clean_thread = None
+        # Unidades lidas uma vez por execução (uma chamada a GetLogicalDrives)
+        self._cached_drives: List[str] = [] if defer_drives else self._enumerate_drives()
+        # Lotes recebidos da varredura que ainda não entraram na tabela
+        self._pending_files: List[FileInfo] = []
+        # Modos de redimensionamento das colunas enquanto estão suspensos
+        self._saved_resize_modes: Optional[List[QHeaderView.ResizeMode]] = None
         
         self._setup_ui()
         self._apply_styles()
@@ -82,7 +233,16 @@ class MainWindow(QMainWindow):
         # Seleção de drives
         drives_label = QLabel("Unidades:")
         self.drives_combo = QComboBox()
-        self._populate_drives()
+        self._apply_drives(self._cached_drives)
+        
+        # Filtro da tabela (caminho, categoria, tamanho ou data)
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filtrar arquivos...")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.setMinimumWidth(200)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DELAY_MS)
         
         # Botões
         self.scan_button = QPushButton("🔍 Escanear")
@@ -96,6 +256,7 @@ class MainWindow(QMainWindow):
         
         controls_layout.addWidget(drives_label)
         controls_layout.addWidget(self.drives_combo)
+        controls_layout.addWidget(self.filter_edit)
         controls_layout.addStretch()
         controls_layout.addWidget(self.scan_button)
         controls_layout.addWidget(self.clean_button)
@@ -110,6 +271,9 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         main_layout.addWidget(self.progress_bar)
         
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(self.PROGRESS_INTERVAL_MS)
+        
         # Label de status
         self.status_label = QLabel("Pronto para escanear")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -134,13 +298,19 @@ class MainWindow(QMainWindow):
         files_group = QGroupBox("Arquivos Encontrados")
         files_layout = QVBoxLayout()
         
-        self.files_table = QTableWidget()
-        self.files_table.setColumnCount(5)
-        self.files_table.setHorizontalHeaderLabels([
-            "Selecionar", "Caminho", "Categoria", "Tamanho", "Última Modificação"
-        ])
+        # A view só consulta o modelo para as linhas visíveis. O filtro fica
+        # no FileFilterProxy e o FlagCacheProxy, mais próximo da view,
+        # memoriza os flags
+        self._model = FileTableModel(self)
+        self._filter_proxy = FileFilterProxy(self._model, self)
+        self._proxy = FlagCacheProxy(self._filter_proxy, self)
+        self.files_table = QTableView()
+        self.files_table.setModel(self._proxy)
+        self.files_table.setItemDelegate(SpeedUpDelegate(self._proxy, self.files_table))
+        self.files_table.setSortingEnabled(True)
+        self.files_table.sortByColumn(-1, Qt.SortOrder.AscendingOrder)
         self.files_table.horizontalHeader().setStretchLastSection(True)
-        self.files_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.files_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.files_table.setAlternatingRowColors(True)
         
         # Checkbox na primeira coluna
@@ -157,108 +327,42 @@ class MainWindow(QMainWindow):
         files_group.setLayout(files_layout)
         main_layout.addWidget(files_group, stretch=1)
     
-    def _populate_drives(self):
-        """Preenche o combo box com drives disponíveis"""
-        import string
+    def populate_drives_async(self):
+        """
+        Enumera as unidades em uma thread do QThreadPool
+        
+        O resultado volta para a thread da interface pelo sinal drives_ready,
+        que preenche o combo box.
+        """
+        QThreadPool.globalInstance().start(lambda: self.drives_ready.emit(self._enumerate_drives()))
+    
+    @staticmethod
+    def _enumerate_drives() -> List[str]:
+        """Lista as unidades disponíveis (pode rodar fora da thread da interface)"""
+        return list_logical_drives()
+    
+    def _apply_drives(self, drives: List[str]):
+        """Preenche o combo box com drives disponíveis (thread da interface)"""
+        self._cached_drives = drives
         self.drives_combo.clear()
         self.drives_combo.addItem("Todas as unidades", None)
         
-        for letter in string.ascii_uppercase:
-            drive = f"{letter}:"
-            if os.path.exists(drive + "\\"):
-                self.drives_combo.addItem(f"{drive} ({drive}\\)", [drive])
+        for drive in drives:
+            self.drives_combo.addItem(f"{drive} ({drive}\\)", [drive])
     
     def _apply_styles(self):
         """Aplica estilos modernos à interface"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-            QProgressBar {
-                border: 2px solid #cccccc;
-                border-radius: 5px;
-                text-align: center;
-                height: 25px;
-            }
-            QProgressBar::chunk {
-                background-color: #4CAF50;
-                border-radius: 3px;
-            }
-            QTableWidget {
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-                background-color: white;
-                gridline-color: #e0e0e0;
-            }
-            QTableWidget::item {
-                padding: 5px;
-            }
-            QTableWidget::item:selected {
-                background-color: #e3f2fd;
-            }
-            QHeaderView::section {
-                background-color: #2196F3;
-                color: white;
-                padding: 8px;
-                border: none;
-                font-weight: bold;
-            }
-            QComboBox {
-                padding: 5px;
-                border: 1px solid #cccccc;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QComboBox:hover {
-                border: 1px solid #2196F3;
-            }
-            QLabel {
-                color: #333333;
-            }
-        """)
+        self.setStyleSheet(_STYLESHEET)
     
     def _connect_signals(self):
         """Conecta sinais e slots"""
         self.scan_button.clicked.connect(self._start_scan)
         self.clean_button.clicked.connect(self._clean_selected)
         self.clean_all_button.clicked.connect(self._clean_all)
-        
-        # Callback de progresso
-        def progress_callback(path):
-            self.status_label.setText(f"Escaneando: {path[:60]}...")
-        
-        self.scanner.set_progress_callback(progress_callback)
+        self._progress_timer.timeout.connect(self._on_scan_progress)
+        self.drives_ready.connect(self._apply_drives, Qt.ConnectionType.QueuedConnection)
+        self.filter_edit.textChanged.connect(self._filter_timer.start)
+        self._filter_timer.timeout.connect(self._apply_filter)
     
     def _start_scan(self):
         """Inicia a varredura de arquivos"""
@@ -279,76 +383,138 @@ class MainWindow(QMainWindow):
         self.status_label.setText("Iniciando varredura...")
         
         # Limpa tabela anterior
-        self.files_table.setRowCount(0)
         self.scanned_files = []
+        self._pending_files = []
+        with self._frozen_table():
+            self._model.set_files(self.scanned_files)
+        
+        # As colunas são ajustadas ao conteúdo uma única vez, no fim da varredura,
+        # e não a cada lote inserido
+        self._suspend_column_resize()
         
         # Cria e inicia thread
         self.scan_thread = ScanThread(self.scanner, drives)
+        self.scan_thread.batch_ready.connect(self._on_scan_batch)
         self.scan_thread.finished.connect(self._on_scan_finished)
         self.scan_thread.error.connect(self._on_scan_error)
         self.scan_thread.start()
+        self._progress_timer.start()
+    
+    def _on_scan_progress(self):
+        """
+        Atualiza a interface durante a varredura (disparado pelo QTimer de progresso)
+        
+        Insere na tabela os lotes recebidos desde o último disparo e mostra o
+        último diretório escaneado.
+        """
+        self._flush_pending_files()
+        path = self.scan_thread.last_path
+        if path:
+            self.status_label.setText(f"Escaneando: {path[:60]}...")
+    
+    def _on_scan_batch(self, files: List[FileInfo]):
+        """Guarda um lote de arquivos encontrados; ele entra na tabela no próximo disparo do timer"""
+        self._pending_files.extend(files)
+    
+    def _flush_pending_files(self):
+        """
+        Acrescenta à tabela, de uma só vez, os lotes pendentes
+        
+        Cada inserção custa uma atualização da view e dos proxies; juntar os
+        lotes de um intervalo do timer evita uma inserção por lote.
+        """
+        if not self._pending_files:
+            return
+        
+        pending, self._pending_files = self._pending_files, []
+        # O modelo compartilha a lista scanned_files, então ela cresce junto
+        self._model.append_files(pending)
     
     def _on_scan_finished(self, files: List[FileInfo]):
-        """Callback quando a varredura termina"""
-        self.scanned_files = files
+        """
+        Callback quando a varredura termina
         
+        Os arquivos já chegaram pelos lotes de batch_ready (os sinais da thread
+        são entregues em ordem); só os lotes ainda pendentes são inseridos, sem
+        recriar a tabela.
+        """
         # Atualiza UI
+        self._progress_timer.stop()
+        self._flush_pending_files()
+        self._restore_column_resize()
+        
+        # Os lotes chegam no fim da lista; reaplica a ordenação escolhida na tabela
+        header = self.files_table.horizontalHeader()
+        if header.isSortIndicatorShown() and header.sortIndicatorSection() >= 0:
+            self._model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
         self.progress_bar.setVisible(False)
         self.scan_button.setEnabled(True)
         
-        if files:
+        if self.scanned_files:
             self.clean_button.setEnabled(True)
             self.clean_all_button.setEnabled(True)
-            self.status_label.setText(f"Varredura concluída! {len(files)} arquivos encontrados.")
+            self.status_label.setText(f"Varredura concluída! {len(self.scanned_files)} arquivos encontrados.")
         else:
             self.status_label.setText("Nenhum arquivo desnecessário encontrado.")
         
-        # Preenche tabela
-        self._populate_table()
         self._update_statistics()
     
     def _on_scan_error(self, error_msg: str):
         """Callback quando ocorre erro na varredura"""
+        self._progress_timer.stop()
+        self._flush_pending_files()
+        self._restore_column_resize()
         self.progress_bar.setVisible(False)
         self.scan_button.setEnabled(True)
         self.status_label.setText(f"Erro: {error_msg}")
         QMessageBox.critical(self, "Erro", f"Erro durante a varredura:\n{error_msg}")
     
-    def _populate_table(self):
-        """Preenche a tabela com arquivos encontrados"""
-        self.files_table.setRowCount(len(self.scanned_files))
-        
-        for row, file_info in enumerate(self.scanned_files):
-            # Checkbox
-            checkbox = QCheckBox()
-            checkbox.setChecked(True)
-            self.files_table.setCellWidget(row, 0, checkbox)
-            
-            # Caminho
-            path_item = QTableWidgetItem(file_info.path)
-            path_item.setToolTip(file_info.path)
-            self.files_table.setItem(row, 1, path_item)
-            
-            # Categoria
-            category_item = QTableWidgetItem(file_info.category)
-            self.files_table.setItem(row, 2, category_item)
-            
-            # Tamanho
-            if file_info.size_mb < 1:
-                size_text = f"{file_info.size / 1024:.2f} KB"
-            elif file_info.size_mb < 1024:
-                size_text = f"{file_info.size_mb:.2f} MB"
-            else:
-                size_text = f"{file_info.size_gb:.2f} GB"
-            size_item = QTableWidgetItem(size_text)
-            size_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.files_table.setItem(row, 3, size_item)
-            
-            # Última modificação
-            import datetime
-            mod_time = datetime.datetime.fromtimestamp(file_info.last_modified)
-            time_item = QTableWidgetItem(mod_time.strftime("%Y-%m-%d %H:%M:%S"))
-            self.files_table.setItem(row, 4, time_item)
+    @contextmanager
+    def _frozen_table(self):
+        """
+        Congela a tabela durante uma alteração em massa do modelo
+        
+        A view não é repintada e as colunas não são medidas até o fim do
+        bloco; depois disso ocorre uma única repintura e um único ajuste.
+        """
+        self.files_table.setUpdatesEnabled(False)
+        suspended = self._suspend_column_resize()
+        try:
+            yield
+        finally:
+            if suspended:
+                self._restore_column_resize()
+            self.files_table.setUpdatesEnabled(True)
+    
+    def _suspend_column_resize(self) -> bool:
+        """
+        Troca as colunas ajustadas ao conteúdo por colunas de largura livre
+        
+        Colunas ResizeToContents são medidas de novo a cada inserção ou
+        remoção de linhas.
+        
+        Returns:
+            True se suspendeu agora, False se já estava suspenso
+        """
+        if self._saved_resize_modes is not None:
+            return False
+        
+        header = self.files_table.horizontalHeader()
+        self._saved_resize_modes = [header.sectionResizeMode(i) for i in range(header.count())]
+        for i, mode in enumerate(self._saved_resize_modes):
+            if mode == QHeaderView.ResizeMode.ResizeToContents:
+                header.setSectionResizeMode(i, QHeaderView.ResizeMode.Interactive)
+        return True
+    
+    def _restore_column_resize(self):
+        """Restaura os modos de redimensionamento salvos por _suspend_column_resize"""
+        if self._saved_resize_modes is None:
+            return
+        
+        header = self.files_table.horizontalHeader()
+        for i, mode in enumerate(self._saved_resize_modes):
+            header.setSectionResizeMode(i, mode)
+        self._saved_resize_modes = None
     
     def _update_statistics(self):
         """Atualiza as estatísticas exibidas"""
@@ -372,15 +538,18 @@ class MainWindow(QMainWindow):
         
         self.category_label.setText(f"Categorias: {categories}")
     
+    def _apply_filter(self):
+        """Filtra a tabela pelo texto digitado (disparado após FILTER_DELAY_MS sem digitação)"""
+        self._filter_proxy.set_filter_text(self.filter_edit.text())
+    
     def _get_selected_files(self) -> List[str]:
-        """Retorna lista de arquivos selecionados"""
-        selected = []
-        for row in range(self.files_table.rowCount()):
-            checkbox = self.files_table.cellWidget(row, 0)
-            if checkbox and checkbox.isChecked():
-                file_info = self.scanned_files[row]
-                selected.append(file_info.path)
-        return selected
+        """Retorna lista de arquivos selecionados (apenas os visíveis, se houver filtro)"""
+        proxy = self._filter_proxy
+        if not proxy.filter_text():
+            return self._model.selected_paths()
+        
+        visible_rows = [proxy.mapToSource(proxy.index(row, 0)).row() for row in range(proxy.rowCount())]
+        return self._model.selected_paths(visible_rows)
     
     def _clean_selected(self):
         """Limpa apenas os arquivos selecionados"""
@@ -421,26 +590,43 @@ class MainWindow(QMainWindow):
             self._execute_cleanup(all_files)
     
     def _execute_cleanup(self, file_paths: List[str]):
-        """Executa a limpeza dos arquivos"""
+        """Inicia a limpeza dos arquivos em background"""
         self.status_label.setText("Limpando arquivos...")
+        self.scan_button.setEnabled(False)
         self.clean_button.setEnabled(False)
         self.clean_all_button.setEnabled(False)
         
-        # Deleta arquivos
-        results = self.scanner.delete_files(file_paths)
+        # Progresso determinado: arquivos processados / total
+        self.progress_bar.setRange(0, len(file_paths))
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        
+        # Deleta arquivos fora da thread da interface
+        self.clean_thread = CleanThread(self.scanner, file_paths)
+        self.clean_thread.progress.connect(self._on_clean_progress)
+        self.clean_thread.finished.connect(self._on_clean_finished)
+        self.clean_thread.error.connect(self._on_clean_error)
+        self.clean_thread.start()
+    
+    def _on_clean_progress(self, done: int, total: int):
+        """Atualiza a barra de progresso da limpeza"""
+        self.progress_bar.setValue(done)
+    
+    def _on_clean_finished(self, results: dict):
+        """Callback quando a limpeza termina"""
+        self._finish_cleanup()
         
         # Conta sucessos e falhas
-        success_count = sum(1 for success in results.values() if success)
+        deleted = {path for path, success in results.items() if success}
+        success_count = len(deleted)
         fail_count = len(results) - success_count
         
-        # Atualiza lista removendo arquivos deletados
-        self.scanned_files = [
-            f for f in self.scanned_files
-            if f.path not in results or not results[f.path]
-        ]
-        
-        # Atualiza UI
-        self._populate_table()
+        # Remove da tabela apenas as linhas dos arquivos deletados; o modelo
+        # compartilha scanned_files, que é atualizada no lugar
+        if deleted:
+            rows = [row for row, file_info in enumerate(self.scanned_files) if file_info.path in deleted]
+            with self._frozen_table():
+                self._model.remove_rows(rows)
         self._update_statistics()
         
         self.status_label.setText(
@@ -463,3 +649,17 @@ class MainWindow(QMainWindow):
         
         self.clean_button.setEnabled(len(self.scanned_files) > 0)
         self.clean_all_button.setEnabled(len(self.scanned_files) > 0)
+    
+    def _on_clean_error(self, error_msg: str):
+        """Callback quando ocorre erro na limpeza"""
+        self._finish_cleanup()
+        self.clean_button.setEnabled(len(self.scanned_files) > 0)
+        self.clean_all_button.setEnabled(len(self.scanned_files) > 0)
+        self.status_label.setText(f"Erro: {error_msg}")
+        QMessageBox.critical(self, "Erro", f"Erro durante a limpeza:\n{error_msg}")
+    
+    def _finish_cleanup(self):
+        """Restaura a barra de progresso (indeterminada) e o botão de varredura"""
+        self.progress_bar.setVisible(False)
+        self.progress_bar.setRange(0, 0)
+        self.scan_button.setEnabled(True)
@@ -0,0 +1,78 @@
+"""
+Delegate da tabela de arquivos
+Busca todos os papéis de pintura de uma célula em uma única chamada ao modelo
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+from PySide6.QtCore import Qt, QAbstractItemModel, QModelIndex
+from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
+
+from frontend.file_table_model import FileTableModel
+
+
+class SpeedUpDelegate(QStyledItemDelegate):
+    """
+    Delegate que monta o QStyleOptionViewItem a partir de um cache por célula
+    
+    O QStyledItemDelegate padrão chama data() uma vez para cada papel de cada
+    célula a cada repintura. Aqui a célula é lida uma vez com
+    FileTableModel.MULTIPLE_ROLES e o resultado fica em um cache LRU.
+    """
+    
+    # Quantidade máxima de células mantidas no cache
+    CACHE_SIZE = 512
+    
+    def __init__(self, model: QAbstractItemModel, parent=None):
+        """
+        Args:
+            model: Modelo exibido pela view; o cache é limpo quando ele muda
+            parent: Objeto pai (normalmente a view)
+        """
+        super().__init__(parent)
+        self.data_cache: "OrderedDict[Tuple[int, int], Dict[int, Any]]" = OrderedDict()
+        
+        # Qualquer mudança no modelo pode alterar ou deslocar as células
+        model.dataChanged.connect(self.clear_cache)
+        model.modelReset.connect(self.clear_cache)
+        model.layoutChanged.connect(self.clear_cache)
+        model.rowsInserted.connect(self.clear_cache)
+        model.rowsRemoved.connect(self.clear_cache)
+    
+    def clear_cache(self, *args):
+        """Descarta todas as células em cache"""
+        self.data_cache.clear()
+    
+    def _cell_data(self, index: QModelIndex) -> Dict[int, Any]:
+        """Retorna os papéis da célula, consultando o modelo só se não estiver em cache"""
+        key = (index.row(), index.column())
+        cache = self.data_cache
+        data = cache.get(key)
+        if data is None:
+            data = index.data(FileTableModel.MULTIPLE_ROLES) or {}
+            cache[key] = data
+            if len(cache) > self.CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return data
+    
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex):
+        """Preenche a opção de estilo com os papéis em cache, sem chamar data() por papel"""
+        data = self._cell_data(index)
+        option.index = index
+        
+        alignment = data.get(Qt.ItemDataRole.TextAlignmentRole)
+        if alignment is not None:
+            option.displayAlignment = alignment
+        
+        check_state = data.get(Qt.ItemDataRole.CheckStateRole)
+        if check_state is not None:
+            option.features |= QStyleOptionViewItem.ViewItemFeature.HasCheckIndicator
+            option.checkState = check_state
+        
+        text = data.get(Qt.ItemDataRole.DisplayRole)
+        if text is not None:
+            option.features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+            option.text = text
@@ -4,18 +4,37 @@ Ponto de entrada da aplicação
 """
 
 import sys
-from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QPixmap
+from PySide6.QtWidgets import QApplication, QSplashScreen
 from frontend.main_window import MainWindow
 
 
+def _create_splash() -> QSplashScreen:
+    """Cria a tela de abertura exibida enquanto a janela principal é montada"""
+    pixmap = QPixmap(400, 200)
+    pixmap.fill(QColor("#2196F3"))
+    splash = QSplashScreen(pixmap)
+    splash.showMessage("Parsews - Carregando...", Qt.AlignmentFlag.AlignCenter, QColor("white"))
+    return splash
+
+
 def main():
     """Função principal que inicia a aplicação"""
     app = QApplication(sys.argv)
     app.setApplicationName("Parsews")
     app.setOrganizationName("Parsews")
     
-    window = MainWindow()
+    # A splash aparece no primeiro quadro, antes de montar a janela
+    splash = _create_splash()
+    splash.show()
+    app.processEvents()
+    
+    # As unidades são enumeradas fora da thread da interface
+    window = MainWindow(defer_drives=True)
+    window.populate_drives_async()
     window.show()
+    splash.finish(window)
     
     sys.exit(app.exec())
 